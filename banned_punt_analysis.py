@@ -10,19 +10,208 @@ This script analyzes punts that would be BANNED under the UFL rule:
   - half_seconds_remaining > 120  (not inside 2-minute warning)
 """
 
-import nfl_data_py as nfl
+import os
+
+import numpy as np
 import pandas as pd
 
 # ── Load data ──────────────────────────────────────────────────────────────────
-pbp = nfl.import_pbp_data([2025], downcast=True)
-pbp = pbp[pbp["season_type"] == "REG"]
+# Read the nflverse parquet release directly (the same file nfl_data_py pulls)
+# so only the columns this script touches are decoded. Every section below
+# works off just two populations — banned punts and 4th-down go-for-it plays —
+# so both row predicates are pushed into the parquet reader as one OR'd filter
+# and nothing else is ever materialized.
+SEASON  = 2025
+PBP_URL = (
+    "https://github.com/nflverse/nflverse-data/releases/download/"
+    "pbp/play_by_play_{season}.parquet"
+)
+
+# Local copy of the pruned, filtered frame so re-runs skip the download.
+# Bump the _v suffix whenever NEEDED_COLS or the filters below change.
+CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    ".cache",
+    f"banned_punt_pbp_{SEASON}_v1.parquet",
+)
+NEEDED_COLS = [
+    "play_type", "yardline_100", "half_seconds_remaining", "ydstogo", "down",
+    "epa", "wp", "wpa", "fourth_down_converted", "score_differential",
+    "season_type",
+]
+
+REG_SEASON = [("season_type", "==", "REG")]
+
+# Banned punt (same logic as ufl_rule_analysis.py):
+#   punt, punting team past midfield, outside the 2-minute warning.
+BANNED_PUNT_FILTER = [
+    ("play_type", "==", "punt"),
+    ("yardline_100", "<", 50),
+    ("half_seconds_remaining", ">", 120),
+]
+
+# All 4th-down plays where teams actually went for it (run or pass).
+# This is the historical baseline for what going for it looks like.
+FOURTH_GO_FILTER = [
+    ("down", "==", 4),
+    ("play_type", "in", ["run", "pass"]),
+]
+
+BUCKET_LABELS = ["0–1", "2–3", "4–5", "6–10", "11+"]
+BUCKET_BINS   = [0, 1, 3, 5, 10, float("inf")]
+
+# String key columns, decoded straight to pandas Categoricals by pyarrow so
+# equality filters and groupbys compare integer codes, not Python strings.
+CATEGORY_COLS = ["play_type", "season_type"]
+
+if os.path.exists(CACHE_PATH):
+    pbp = pd.read_parquet(CACHE_PATH)
+else:
+    pbp = pd.read_parquet(
+        PBP_URL.format(season=SEASON),
+        columns=NEEDED_COLS,
+        filters=[REG_SEASON + BANNED_PUNT_FILTER, REG_SEASON + FOURTH_GO_FILTER],
+        read_dictionary=CATEGORY_COLS,
+    )
+
+    # Same float64 → float32 downcast nfl_data_py applies with downcast=True:
+    # halves the bytes every mask and aggregation below reads, and the printed
+    # stats only go to three decimals. Integer-valued columns (ydstogo,
+    # score_differential, down) can be missing, so they stay float, not int16.
+    _float_cols = pbp.select_dtypes("float64").columns
+    pbp[_float_cols] = pbp[_float_cols].astype("float32")
+
+    # Written to a temp file and moved into place, so an interrupted run never
+    # leaves a truncated cache behind for the next one to read.
+    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+    pbp.to_parquet(CACHE_PATH + ".tmp", compression="zstd")
+    os.replace(CACHE_PATH + ".tmp", CACHE_PATH)
+
+# ydstogo bucket, coded once here; the categorical carries through every slice.
+# Same right-closed bins as pd.cut(..., include_lowest=True), but the int8
+# codes come straight from a searchsorted over the inner edges, and missing
+# or out-of-range distances get -1 (NaN).
+_ytg  = pbp["ydstogo"].to_numpy()
+_code = np.searchsorted(BUCKET_BINS[1:-1], _ytg, side="left").astype(np.int8)
+_code[np.isnan(_ytg) | (_ytg < BUCKET_BINS[0])] = -1
+pbp["bucket"] = pd.Categorical.from_codes(_code, categories=BUCKET_LABELS, ordered=True)
+
+# Win probability after the play resolves (see Section E assumptions).
+pbp["post_play_wp"] = pbp["wp"] + pbp["wpa"]
+
+# Score situation at the snap.
+# score_differential = possession team score minus opponent score.
+# Trailing (1 score)  = down 1–8 pts  (a TD+2pt conversion closes the gap)
+# Trailing (2+ scores) = down 9+ pts
+SITUATION_ORDER = ["Leading", "Tied", "Trailing (1 score)", "Trailing (2+ scores)"]
+
+# First matching condition wins; anything else (incl. missing) is 2+ scores.
+# Selected as int8 codes into SITUATION_ORDER, so no label strings are built.
+_diff = pbp["score_differential"].to_numpy()
+pbp["situation"] = pd.Categorical.from_codes(
+    np.select([_diff > 0, _diff == 0, _diff >= -8], [0, 1, 2], default=3).astype(np.int8),
+    categories=SITUATION_ORDER,
+    ordered=True,
+)
 
-# ── Isolate banned punts (same logic as ufl_rule_analysis.py) ─────────────────
-punts             = pbp[pbp["play_type"] == "punt"]
-punts_in_opp      = punts[punts["yardline_100"] < 50]
-banned_punts      = punts_in_opp[punts_in_opp["half_seconds_remaining"] > 120]
+# The two populations are disjoint on play_type. Sections A/B only need two
+# columns of the banned punts, so select those by mask rather than copying
+# out a sub-frame.
+pbp["is_banned_punt"] = pbp["play_type"] == "punt"
+
+_is_banned = pbp["is_banned_punt"].to_numpy()
+
+# ── Aggregate once ─────────────────────────────────────────────────────────────
+# Sections C–G are all means over some subset of plays, sliced by population,
+# bucket, situation and 4th-down outcome. Group pbp once on all four keys and
+# keep per-cell sums and non-null counts; each section then re-aggregates this
+# small cell table instead of rescanning the play-level frame.
+# bucket is keyed on its int8 codes (-1 = missing ydstogo): pandas < 2 drops
+# NaN categorical keys even with dropna=False, which would lose those plays
+# from every overall mean. cell_means maps the codes back to BUCKET_LABELS.
+STAT_COLS = ["epa", "wp", "post_play_wp", "ydstogo", "fourth_down_converted"]
+CELL_KEYS = ["is_banned_punt", "bucket", "situation", "fourth_down_converted"]
+
+# Pull the stats out as one C-contiguous (plays x stats) float32 block, so the
+# fill and null-mask passes each run once over the whole block instead of
+# column by column.
+_stats = np.ascontiguousarray(pbp[STAT_COLS].to_numpy(dtype=np.float32))
+_seen  = ~np.isnan(_stats)
+cells = (
+    pd.concat(
+        [
+            pd.DataFrame(np.where(_seen, _stats, np.float32(0)), index=pbp.index,
+                         columns=[f"{c}_sum" for c in STAT_COLS]),
+            pd.DataFrame(_seen, index=pbp.index,
+                         columns=[f"{c}_n" for c in STAT_COLS]),
+        ],
+        axis=1,
+    )
+    .assign(plays=1)
+    .groupby(
+        [pbp[k].cat.codes.rename(k) if k == "bucket" else pbp[k] for k in CELL_KEYS],
+        observed=True, dropna=False,
+    )
+    .sum()
+    .reset_index()
+)
 
-n_banned = len(banned_punts)
+punt_cells = cells[cells["is_banned_punt"]]
+go_cells   = cells[~cells["is_banned_punt"]]
+
+
+def cell_means(cells, by=None):
+    # Collapse a slice of the cell table to play counts, non-null counts
+    # (<stat>_n) and means (<stat>) — per `by` group, or one overall row.
+    value_cols = [c for c in cells.columns if c not in CELL_KEYS]
+    if by is None:
+        totals = cells[value_cols].sum().to_frame().T
+    else:
+        totals = cells.groupby(by, observed=True)[value_cols].sum()
+        if by == "bucket":
+            # Drop missing-ydstogo cells (code -1) and relabel the rest.
+            totals = totals[totals.index >= 0]
+            totals.index = pd.CategoricalIndex(
+                pd.Categorical.from_codes(totals.index, BUCKET_LABELS, ordered=True),
+                name="bucket",
+            )
+    for col in STAT_COLS:
+        totals[col] = totals[f"{col}_sum"] / totals[f"{col}_n"]
+    return totals if by is not None else totals.iloc[0]
+
+
+def go_for_it_by_bucket(go_cells):
+    # Attempts, conversion rate and outcome-split EPA / post-play WP per bucket.
+    converted = go_cells["fourth_down_converted"]
+    every = cell_means(go_cells, "bucket")
+    conv  = cell_means(go_cells[converted == 1], "bucket")
+    fail  = cell_means(go_cells[converted == 0], "bucket")
+    return pd.DataFrame({
+        "go_attempts"     : every["fourth_down_converted_n"],
+        "conversions"     : every["fourth_down_converted_sum"],
+        "conv_rate"       : every["fourth_down_converted"],
+        "epa_if_converted": conv["epa"],
+        "epa_if_failed"   : fail["epa"],
+        "wp_if_converted" : conv["post_play_wp"],
+        "wp_if_failed"    : fail["post_play_wp"],
+    })
+
+
+def expected_go_wp(go_cells):
+    # P(convert) * mean(post-play WP | converted) + P(fail) * mean(... | failed),
+    # all from one pass grouped on the outcome.
+    by_outcome = cell_means(go_cells, "fourth_down_converted")
+    conv_rate  = (
+        by_outcome["fourth_down_converted_sum"].sum()
+        / by_outcome["fourth_down_converted_n"].sum()
+    )
+    post_wp = by_outcome["post_play_wp"]
+    return (
+        conv_rate * post_wp.get(1, np.nan)
+        + (1 - conv_rate) * post_wp.get(0, np.nan)
+    )
+
+n_banned = int(np.count_nonzero(_is_banned))
 
 print("=" * 65)
 print(f"Banned punts identified: {n_banned:,}")
@@ -33,7 +222,7 @@ print()
 # SECTION A: DISTRIBUTION OF 4TH-DOWN DISTANCE (ydstogo)
 # ==============================================================================
 
-ydstogo = banned_punts["ydstogo"]
+ydstogo = pbp.loc[_is_banned, "ydstogo"]
 
 print("=" * 65)
 print("SECTION A — 4th-Down Distance on Banned Punts")
@@ -44,20 +233,9 @@ print(f"  Std dev:             {ydstogo.std():.1f}")
 print()
 
 # ── Bucketed distribution ──────────────────────────────────────────────────────
-BUCKET_LABELS = ["0–1", "2–3", "4–5", "6–10", "11+"]
-BUCKET_BINS   = [0, 1, 3, 5, 10, float("inf")]
-
-bucket_counts = (
-    pd.cut(
-        ydstogo,
-        bins=BUCKET_BINS,
-        labels=BUCKET_LABELS,
-        right=True,
-        include_lowest=True,
-    )
-    .value_counts()
-    .reindex(BUCKET_LABELS)
-)
+# bucket is categorical, so sort=False already yields every label in
+# BUCKET_LABELS order (empty buckets as 0) with no sort or reindex.
+bucket_counts = pbp.loc[_is_banned, "bucket"].value_counts(sort=False)
 
 bucket_pct = (bucket_counts / n_banned * 100).round(1)
 
@@ -74,16 +252,18 @@ print()
 # SECTION B: BRACKET BREAKDOWN
 # ==============================================================================
 
-short   = banned_punts[banned_punts["ydstogo"] <= 2]
-medium  = banned_punts[(banned_punts["ydstogo"] >= 3) & (banned_punts["ydstogo"] <= 5)]
-long_   = banned_punts[banned_punts["ydstogo"] >= 6]
+# Counts only, straight off the Section A ydstogo array.
+_banned_ytg = ydstogo.to_numpy()
+n_short     = int(np.count_nonzero(_banned_ytg <= 2))
+n_medium    = int(np.count_nonzero((_banned_ytg >= 3) & (_banned_ytg <= 5)))
+n_long      = int(np.count_nonzero(_banned_ytg >= 6))
 
 print("=" * 65)
 print("SECTION B — Banned Punts by Distance Bracket")
 print("=" * 65)
-print(f"  4th-and-2 or less  (short):  {len(short):>4,}  ({len(short)/n_banned*100:.1f}%)")
-print(f"  4th-and-3 to 5     (medium): {len(medium):>4,}  ({len(medium)/n_banned*100:.1f}%)")
-print(f"  4th-and-6 or more  (long):   {len(long_):>4,}  ({len(long_)/n_banned*100:.1f}%)")
+print(f"  4th-and-2 or less  (short):  {n_short:>4,}  ({n_short/n_banned*100:.1f}%)")
+print(f"  4th-and-3 to 5     (medium): {n_medium:>4,}  ({n_medium/n_banned*100:.1f}%)")
+print(f"  4th-and-6 or more  (long):   {n_long:>4,}  ({n_long/n_banned*100:.1f}%)")
 print()
 
 # ==============================================================================
@@ -91,15 +271,10 @@ print()
 # ==============================================================================
 
 # Average EPA of the banned punt plays themselves.
-avg_punt_epa = banned_punts["epa"].mean()
+avg_punt_epa = cell_means(punt_cells)["epa"]
 
-# All 4th-down plays where teams actually went for it (run or pass).
-# This is the historical baseline for what going for it looks like.
-fourth_go = pbp[
-    (pbp["down"] == 4) &
-    (pbp["play_type"].isin(["run", "pass"]))
-]
-avg_go_epa = fourth_go["epa"].mean()
+# Historical go-for-it baseline (see FOURTH_GO_FILTER).
+avg_go_epa = cell_means(go_cells)["epa"]
 
 print("=" * 65)
 print("SECTION C — EPA: Banned Punts vs Going For It")
@@ -136,70 +311,22 @@ print("  - Modeling rule impact only; no adaptive strategy assumed")
 print()
 
 # Build historical conversion stats per bucket from actual go-for-it plays.
-fourth_go_bucketed = fourth_go.copy()
-fourth_go_bucketed["bucket"] = pd.cut(
-    fourth_go_bucketed["ydstogo"],
-    bins=BUCKET_BINS,
-    labels=BUCKET_LABELS,
-    right=True,
-    include_lowest=True,
-)
-
-# Compute each stat separately to avoid pandas version compatibility issues
-# with groupby.apply(include_groups=).
-_base = fourth_go_bucketed.groupby("bucket", observed=True)
-
-_attempts = _base["fourth_down_converted"].agg(
-    go_attempts="count",
-    conversions="sum",
-    conv_rate="mean",
-)
-
-_epa_conv = (
-    fourth_go_bucketed[fourth_go_bucketed["fourth_down_converted"] == 1]
-    .groupby("bucket", observed=True)["epa"]
-    .mean()
-    .rename("epa_if_converted")
-)
-
-_epa_fail = (
-    fourth_go_bucketed[fourth_go_bucketed["fourth_down_converted"] == 0]
-    .groupby("bucket", observed=True)["epa"]
-    .mean()
-    .rename("epa_if_failed")
-)
-
-conversion_stats = (
-    _attempts
-    .join(_epa_conv)
-    .join(_epa_fail)
-    .reindex(BUCKET_LABELS)
-)
+conversion_stats = go_for_it_by_bucket(go_cells).reindex(BUCKET_LABELS)
 
 conversion_stats["exp_epa_go"] = (
     conversion_stats["conv_rate"] * conversion_stats["epa_if_converted"]
     + (1 - conversion_stats["conv_rate"]) * conversion_stats["epa_if_failed"]
 )
 
-# Average EPA of the banned punts within each bucket.
-banned_punts_bucketed = banned_punts.copy()
-banned_punts_bucketed["bucket"] = pd.cut(
-    banned_punts_bucketed["ydstogo"],
-    bins=BUCKET_BINS,
-    labels=BUCKET_LABELS,
-    right=True,
-    include_lowest=True,
-)
-
-punt_epa_by_bucket = (
-    banned_punts_bucketed
-    .groupby("bucket", observed=True)["epa"]
-    .mean()
+# Average EPA and post-punt WP (wp + wpa, used in Section E) of the banned
+# punts within each bucket.
+punt_by_bucket = (
+    cell_means(punt_cells, "bucket")
+    .rename(columns={"epa": "avg_punt_epa", "post_play_wp": "avg_post_punt_wp"})
     .reindex(BUCKET_LABELS)
-    .rename("avg_punt_epa")
 )
 
-results = conversion_stats.join(punt_epa_by_bucket)
+results = conversion_stats.join(punt_by_bucket[["avg_punt_epa"]])
 results["epa_swing"] = results["exp_epa_go"] - results["avg_punt_epa"]
 
 # Format for readability
@@ -208,12 +335,12 @@ display = results[[
     "epa_if_failed", "exp_epa_go", "avg_punt_epa", "epa_swing"
 ]].copy()
 
-display["conv_rate"]       = display["conv_rate"].map("{:.1%}".format)
-display["epa_if_converted"] = display["epa_if_converted"].map("{:+.3f}".format)
-display["epa_if_failed"]   = display["epa_if_failed"].map("{:+.3f}".format)
-display["exp_epa_go"]      = display["exp_epa_go"].map("{:+.3f}".format)
-display["avg_punt_epa"]    = display["avg_punt_epa"].map("{:+.3f}".format)
-display["epa_swing"]       = display["epa_swing"].map("{:+.3f}".format)
+display["conv_rate"]       = np.char.mod("%.1f%%", display["conv_rate"].to_numpy() * 100)
+display["epa_if_converted"] = np.char.mod("%+.3f", display["epa_if_converted"].to_numpy())
+display["epa_if_failed"]   = np.char.mod("%+.3f", display["epa_if_failed"].to_numpy())
+display["exp_epa_go"]      = np.char.mod("%+.3f", display["exp_epa_go"].to_numpy())
+display["avg_punt_epa"]    = np.char.mod("%+.3f", display["avg_punt_epa"].to_numpy())
+display["epa_swing"]       = np.char.mod("%+.3f", display["epa_swing"].to_numpy())
 
 print(display.to_string())
 print()
@@ -245,16 +372,10 @@ print("  - Modeling rule impact only; no adaptive strategy assumed")
 print()
 
 # ── Headline: overall avg pre-play WP and post-punt WP ────────────────────────
-avg_wp_before_punt  = banned_punts["wp"].mean()
-avg_wp_after_punt   = (banned_punts["wp"] + banned_punts["wpa"]).mean()
-avg_wp_go_overall   = (
-    fourth_go["fourth_down_converted"].mean() *
-        (fourth_go.loc[fourth_go["fourth_down_converted"] == 1, "wp"] +
-         fourth_go.loc[fourth_go["fourth_down_converted"] == 1, "wpa"]).mean()
-    + (1 - fourth_go["fourth_down_converted"].mean()) *
-        (fourth_go.loc[fourth_go["fourth_down_converted"] == 0, "wp"] +
-         fourth_go.loc[fourth_go["fourth_down_converted"] == 0, "wpa"]).mean()
-)
+_punt_overall       = cell_means(punt_cells)
+avg_wp_before_punt  = _punt_overall["wp"]
+avg_wp_after_punt   = _punt_overall["post_play_wp"]
+avg_wp_go_overall   = expected_go_wp(go_cells)
 
 print(f"  Avg WP before banned punt:               {avg_wp_before_punt:>6.3f}")
 print(f"  Avg WP after punt (wp + wpa):            {avg_wp_after_punt:>6.3f}")
@@ -263,43 +384,10 @@ print(f"  Overall WP swing (go-for-it vs punt):   {avg_wp_go_overall - avg_wp_af
 print()
 
 # ── Bucket-level WP swing ──────────────────────────────────────────────────────
-# Post-play WP for historical go-for-it plays.
-fourth_go_bucketed["post_play_wp"] = fourth_go_bucketed["wp"] + fourth_go_bucketed["wpa"]
-
-_wp_conv = (
-    fourth_go_bucketed[fourth_go_bucketed["fourth_down_converted"] == 1]
-    .groupby("bucket", observed=True)["post_play_wp"]
-    .mean()
-    .rename("wp_if_converted")
-)
-
-_wp_fail = (
-    fourth_go_bucketed[fourth_go_bucketed["fourth_down_converted"] == 0]
-    .groupby("bucket", observed=True)["post_play_wp"]
-    .mean()
-    .rename("wp_if_failed")
-)
-
-# Post-punt WP for each banned punt bucket.
-banned_punts_bucketed["post_punt_wp"] = (
-    banned_punts_bucketed["wp"] + banned_punts_bucketed["wpa"]
-)
-
-punt_wp_by_bucket = (
-    banned_punts_bucketed
-    .groupby("bucket", observed=True)["post_punt_wp"]
-    .mean()
-    .reindex(BUCKET_LABELS)
-    .rename("avg_post_punt_wp")
-)
-
-# Reuse conv_rate from Section D conversion_stats.
+# Reuse the Section D per-bucket tables.
 wp_results = (
-    conversion_stats[["conv_rate"]]
-    .join(_wp_conv)
-    .join(_wp_fail)
-    .join(punt_wp_by_bucket)
-    .reindex(BUCKET_LABELS)
+    conversion_stats[["conv_rate", "wp_if_converted", "wp_if_failed"]]
+    .join(punt_by_bucket[["avg_post_punt_wp"]])
 )
 
 wp_results["exp_wp_go"] = (
@@ -315,12 +403,12 @@ wp_display = wp_results[[
     "exp_wp_go", "avg_post_punt_wp", "wp_swing"
 ]].copy()
 
-wp_display["conv_rate"]       = wp_display["conv_rate"].map("{:.1%}".format)
-wp_display["wp_if_converted"] = wp_display["wp_if_converted"].map("{:.3f}".format)
-wp_display["wp_if_failed"]    = wp_display["wp_if_failed"].map("{:.3f}".format)
-wp_display["exp_wp_go"]       = wp_display["exp_wp_go"].map("{:.3f}".format)
-wp_display["avg_post_punt_wp"]= wp_display["avg_post_punt_wp"].map("{:.3f}".format)
-wp_display["wp_swing"]        = wp_display["wp_swing"].map("{:+.3f}".format)
+wp_display["conv_rate"]       = np.char.mod("%.1f%%", wp_display["conv_rate"].to_numpy() * 100)
+wp_display["wp_if_converted"] = np.char.mod("%.3f", wp_display["wp_if_converted"].to_numpy())
+wp_display["wp_if_failed"]    = np.char.mod("%.3f", wp_display["wp_if_failed"].to_numpy())
+wp_display["exp_wp_go"]       = np.char.mod("%.3f", wp_display["exp_wp_go"].to_numpy())
+wp_display["avg_post_punt_wp"]= np.char.mod("%.3f", wp_display["avg_post_punt_wp"].to_numpy())
+wp_display["wp_swing"]        = np.char.mod("%+.3f", wp_display["wp_swing"].to_numpy())
 
 print(wp_display.to_string())
 print()
@@ -331,33 +419,12 @@ print()
 # ==============================================================================
 # SECTION F: BANNED PUNTS BY SCORE DIFFERENTIAL AT TIME OF PUNT
 # ==============================================================================
-# score_differential = possession team score minus opponent score.
-# Trailing (1 score)  = down 1–8 pts  (a TD+2pt conversion closes the gap)
-# Trailing (2+ scores) = down 9+ pts
-
-def score_situation(diff):
-    if diff > 0:
-        return "Leading"
-    elif diff == 0:
-        return "Tied"
-    elif diff >= -8:
-        return "Trailing (1 score)"
-    else:
-        return "Trailing (2+ scores)"
-
-SITUATION_ORDER = ["Leading", "Tied", "Trailing (1 score)", "Trailing (2+ scores)"]
-
-banned_punts_scored = banned_punts.assign(
-    situation=banned_punts["score_differential"].apply(score_situation)
-)
+# Situation buckets are defined with SITUATION_ORDER at the top of the script.
 
 situation_stats = (
-    banned_punts_scored
-    .groupby("situation")
-    .agg(
-        count      =("ydstogo", "count"),
-        avg_ydstogo=("ydstogo", "mean"),
-    )
+    cell_means(punt_cells, "situation")
+    .rename(columns={"ydstogo_n": "count", "ydstogo": "avg_ydstogo"})
+    [["count", "avg_ydstogo"]]
     .reindex(SITUATION_ORDER)
 )
 
@@ -382,11 +449,12 @@ print()
 # WP reference for go-for-it outcomes is also filtered to leading situations
 # so that the post-play WP values reflect a comparable game state.
 
-leading_banned = banned_punts[banned_punts["score_differential"] > 0].copy()
-n_leading      = len(leading_banned)
+# "Leading" is exactly score_differential > 0.
+leading_punt_cells = punt_cells[punt_cells["situation"] == "Leading"]
+n_leading          = int(leading_punt_cells["plays"].sum())
 
 # Historical go-for-it plays when team was also leading.
-fourth_go_leading = fourth_go[fourth_go["score_differential"] > 0].copy()
+leading_go_cells = go_cells[go_cells["situation"] == "Leading"]
 
 print("=" * 65)
 print("SECTION G — WP Swing on Banned Punts When Team Was LEADING")
@@ -401,22 +469,13 @@ print("  - Same ydstogo buckets and conversion modeling as Section D/E")
 print()
 
 # ── Headline numbers ───────────────────────────────────────────────────────────
-avg_wp_before  = leading_banned["wp"].mean()
-avg_wp_after   = (leading_banned["wp"] + leading_banned["wpa"]).mean()
+_lead_punt_overall = cell_means(leading_punt_cells)
+avg_wp_before      = _lead_punt_overall["wp"]
+avg_wp_after       = _lead_punt_overall["post_play_wp"]
 
 # Expected WP if gone for it (overall, not bucketed) — weighted by conv rate
 # derived from leading go-for-it plays.
-_lead_conv_rate = fourth_go_leading["fourth_down_converted"].mean()
-_lead_wp_conv   = (
-    fourth_go_leading.loc[fourth_go_leading["fourth_down_converted"] == 1, "wp"] +
-    fourth_go_leading.loc[fourth_go_leading["fourth_down_converted"] == 1, "wpa"]
-).mean()
-_lead_wp_fail   = (
-    fourth_go_leading.loc[fourth_go_leading["fourth_down_converted"] == 0, "wp"] +
-    fourth_go_leading.loc[fourth_go_leading["fourth_down_converted"] == 0, "wpa"]
-).mean()
-
-avg_wp_go_leading = _lead_conv_rate * _lead_wp_conv + (1 - _lead_conv_rate) * _lead_wp_fail
+avg_wp_go_leading = expected_go_wp(leading_go_cells)
 
 print(f"  Avg WP before punt (while leading):      {avg_wp_before:>6.3f}")
 print(f"  Avg WP after punt  (wp + wpa):           {avg_wp_after:>6.3f}")
@@ -425,50 +484,22 @@ print(f"  Overall WP swing (go-for-it vs punt):   {avg_wp_go_leading - avg_wp_af
 print()
 
 # ── Bucket-level breakdown ─────────────────────────────────────────────────────
-leading_banned["bucket"] = pd.cut(
-    leading_banned["ydstogo"],
-    bins=BUCKET_BINS, labels=BUCKET_LABELS, right=True, include_lowest=True,
-)
-fourth_go_leading["bucket"] = pd.cut(
-    fourth_go_leading["ydstogo"],
-    bins=BUCKET_BINS, labels=BUCKET_LABELS, right=True, include_lowest=True,
-)
-fourth_go_leading["post_play_wp"] = fourth_go_leading["wp"] + fourth_go_leading["wpa"]
-
-# Conversion rate per bucket (from leading go-for-it plays).
-_lead_attempts = (
-    fourth_go_leading
-    .groupby("bucket", observed=True)["fourth_down_converted"]
-    .agg(go_attempts="count", conv_rate="mean")
-)
-
-# Post-play WP split by outcome (from leading go-for-it plays).
-_lead_wp_c = (
-    fourth_go_leading[fourth_go_leading["fourth_down_converted"] == 1]
-    .groupby("bucket", observed=True)["post_play_wp"]
-    .mean()
-    .rename("wp_if_converted")
-)
-_lead_wp_f = (
-    fourth_go_leading[fourth_go_leading["fourth_down_converted"] == 0]
-    .groupby("bucket", observed=True)["post_play_wp"]
-    .mean()
-    .rename("wp_if_failed")
-)
+# Conversion rate and post-play WP split by outcome, per bucket (from leading
+# go-for-it plays).
+_lead_stats = go_for_it_by_bucket(leading_go_cells)[
+    ["go_attempts", "conv_rate", "wp_if_converted", "wp_if_failed"]
+]
 
 # Post-punt WP for leading banned punts per bucket.
 _lead_punt_wp = (
-    leading_banned
-    .assign(post_punt_wp=leading_banned["wp"] + leading_banned["wpa"])
-    .groupby("bucket", observed=True)
-    .agg(punt_count=("post_punt_wp", "count"), avg_post_punt_wp=("post_punt_wp", "mean"))
+    cell_means(leading_punt_cells, "bucket")
+    .rename(columns={"post_play_wp_n": "punt_count", "post_play_wp": "avg_post_punt_wp"})
+    [["punt_count", "avg_post_punt_wp"]]
     .reindex(BUCKET_LABELS)
 )
 
 g_results = (
-    _lead_attempts
-    .join(_lead_wp_c)
-    .join(_lead_wp_f)
+    _lead_stats
     .join(_lead_punt_wp)
     .reindex(BUCKET_LABELS)
 )
@@ -484,12 +515,12 @@ g_display = g_results[[
     "wp_if_failed", "exp_wp_go", "avg_post_punt_wp", "wp_swing"
 ]].copy()
 
-g_display["conv_rate"]        = g_display["conv_rate"].map("{:.1%}".format)
-g_display["wp_if_converted"]  = g_display["wp_if_converted"].map("{:.3f}".format)
-g_display["wp_if_failed"]     = g_display["wp_if_failed"].map("{:.3f}".format)
-g_display["exp_wp_go"]        = g_display["exp_wp_go"].map("{:.3f}".format)
-g_display["avg_post_punt_wp"] = g_display["avg_post_punt_wp"].map("{:.3f}".format)
-g_display["wp_swing"]         = g_display["wp_swing"].map("{:+.3f}".format)
+g_display["conv_rate"]        = np.char.mod("%.1f%%", g_display["conv_rate"].to_numpy() * 100)
+g_display["wp_if_converted"]  = np.char.mod("%.3f", g_display["wp_if_converted"].to_numpy())
+g_display["wp_if_failed"]     = np.char.mod("%.3f", g_display["wp_if_failed"].to_numpy())
+g_display["exp_wp_go"]        = np.char.mod("%.3f", g_display["exp_wp_go"].to_numpy())
+g_display["avg_post_punt_wp"] = np.char.mod("%.3f", g_display["avg_post_punt_wp"].to_numpy())
+g_display["wp_swing"]         = np.char.mod("%+.3f", g_display["wp_swing"].to_numpy())
 
 print(g_display.to_string())
 print()
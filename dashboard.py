@@ -8,10 +8,12 @@ responses. Teams are assumed to behave exactly as they did historically.
 """
 
 import os
+import pickle
+import time
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
-import nfl_data_py as nfl
 
 # ── Page config ────────────────────────────────────────────────────────────────
 st.set_page_config(
@@ -41,6 +43,28 @@ REQUIRED_SNEAK_COLS = {
     "home_team", "total_home_score", "total_away_score",
 }
 
+# Low-cardinality string columns that are filtered / grouped on; stored as
+# Categoricals so comparisons and groupbys work on integer codes.
+CATEGORY_COLS = ["posteam", "home_team", "play_type", "season_type", "field_goal_result"]
+
+# Everything any compute_* function reads. load_pbp validates REQUIRED_COLS
+# once and keeps only NEEDED_COLS (adds the optional qb_sneak) out of the ~400
+# nflverse columns.
+REQUIRED_COLS = (
+    REQUIRED_PUNT_COLS | REQUIRED_FG_COLS | REQUIRED_EPA_COLS
+    | REQUIRED_SNEAK_COLS | {"season_type"}
+)
+NEEDED_COLS = REQUIRED_COLS | {"qb_sneak"}
+
+# On-disk copies of each season's REG play-by-play and computed tables, so a
+# fresh process or an expired st.cache_data entry reads local files instead of
+# re-downloading and recomputing. Files older than CACHE_TTL are rebuilt, same
+# as the in-memory caches. Bump CACHE_VERSION whenever NEEDED_COLS, the stored
+# dtypes, the derived columns added in load_pbp or the cached tables change.
+CACHE_DIR     = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+CACHE_VERSION = 6
+CACHE_TTL     = 86400
+
 
 # ── Helpers ────────────────────────────────────────────────────────────────────
 def _check_cols(df: pd.DataFrame, required: set, label: str):
@@ -53,199 +77,312 @@ def _check_cols(df: pd.DataFrame, required: set, label: str):
         st.stop()
 
 
-def score_situation(diff):
-    if diff > 0:      return "Leading"
-    elif diff == 0:   return "Tied"
-    elif diff >= -8:  return "Trailing (1 score)"
-    else:             return "Trailing (2+ scores)"
+def _is_fresh(path: str) -> bool:
+    return os.path.exists(path) and time.time() - os.path.getmtime(path) < CACHE_TTL
 
 
-# ── Data loading ───────────────────────────────────────────────────────────────
-@st.cache_data(ttl=86400, show_spinner="Loading NFL play-by-play data…")
-def load_pbp(season: int) -> pd.DataFrame:
-    pbp = nfl.import_pbp_data([season], downcast=True)
-    return pbp[pbp["season_type"] == "REG"].copy()
+def _disk_cached(name: str, season: int, build) -> dict:
+    # Pickled copy of a season's computed tables, rebuilt via build(season) once
+    # stale or unreadable (e.g. pickled under another pandas version). Best
+    # effort, as in load_pbp; written via a temp file so a concurrent reader
+    # never sees a partial pickle.
+    path = os.path.join(CACHE_DIR, f"{name}_{season}_v{CACHE_VERSION}.pkl")
+    if _is_fresh(path):
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            pass
 
+    result = build(season)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(path + ".tmp", "wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(path + ".tmp", path)
+    except OSError:
+        pass
+    return result
+
+
+def _yard_bins(values: np.ndarray, max_bins: int = 25) -> np.ndarray:
+    # Integer-aligned histogram edges: one bin per yard, widened to whole-yard
+    # multiples so there are at most max_bins of them.
+    if not len(values):
+        return np.array([0.0, 1.0])
+    lo, hi = np.floor(values.min()), np.ceil(values.max())
+    width  = max(1.0, np.ceil((hi - lo + 1) / max_bins))
+    n_bins = int(np.ceil((hi - lo + 1) / width))
+    return lo - 0.5 + width * np.arange(n_bins + 1)
+
+
+def score_situation(diff: pd.Series) -> pd.Categorical:
+    # Leading / Tied / Trailing (1 score: down 1–8) / Trailing (2+ scores),
+    # vectorised over score_differential. Anything unmatched (incl. missing)
+    # is 2+ scores. Selects int8 codes straight into SITUATION_ORDER rather
+    # than building (and re-factorising) an array of label strings.
+    arr   = diff.to_numpy()
+    codes = np.select([arr > 0, arr == 0, arr >= -8], [0, 1, 2], default=3).astype(np.int8)
+    return pd.Categorical.from_codes(codes, categories=SITUATION_ORDER, ordered=True)
 
-# ── Computation: punts ────────────────────────────────────────────────────────
-# min_punts is intentionally NOT a cache key here — it only filters the display
-# of the team table, so moving it to the UI avoids busting the punt cache every
-# time the sidebar slider is nudged.
-@st.cache_data(ttl=86400, show_spinner=False)
-def compute_punts(season: int, exclude_2min: bool):
-    pbp = load_pbp(season)
-    _check_cols(pbp, REQUIRED_PUNT_COLS, "punts")
-
-    punts        = pbp[pbp["play_type"] == "punt"].copy()
-    punts_in_opp = punts[punts["yardline_100"] < 50]
-
-    if exclude_2min:
-        punts_exempt = punts_in_opp[punts_in_opp["half_seconds_remaining"] <= 120]
-        banned       = punts_in_opp[punts_in_opp["half_seconds_remaining"] > 120].copy()
-    else:
-        punts_exempt = pd.DataFrame(columns=punts_in_opp.columns)
-        banned       = punts_in_opp.copy()
-
-    n_total  = len(punts)
-    n_opp    = len(punts_in_opp)
-    n_exempt = len(punts_exempt)
-    n_banned = len(banned)
-
-    summary = {
-        "total_punts":   n_total,
-        "opp_territory": n_opp,
-        "exempt":        n_exempt,
-        "banned":        n_banned,
-        "pct_banned":    n_banned / n_total * 100 if n_total > 0 else 0.0,
-    }
-
-    # ── Team table (unfiltered — min_punts applied in UI) ──────────────────────
-    banned_by_team = banned.groupby("posteam").size().rename("banned_punts")
-    team_table = (
-        punts.groupby("posteam").agg(total_punts=("play_type", "count"))
-        .join(banned_by_team, how="left")
-        .fillna({"banned_punts": 0})
-        .assign(
-            banned_punts=lambda df: df["banned_punts"].astype(int),
-            pct_banned  =lambda df: (df["banned_punts"] / df["total_punts"] * 100).round(1),
-        )
-        .sort_values("banned_punts", ascending=False)
-    )
-    team_table.index.name = "Team"
-    team_table.columns    = ["Total Punts", "Banned Punts", "% Banned"]
-
-    # ── Situation breakdown ────────────────────────────────────────────────────
-    banned_scored = banned.assign(
-        situation=banned["score_differential"].apply(score_situation)
-    )
-    situation_df = (
-        banned_scored.groupby("situation")
-        .agg(count=("ydstogo", "count"), avg_ydstogo=("ydstogo", "mean"))
-        .reindex(SITUATION_ORDER)
-        .assign(pct=lambda df: (df["count"] / n_banned * 100).round(1) if n_banned > 0 else 0)
-        [["count", "pct", "avg_ydstogo"]]
-    )
-    situation_df.columns    = ["Count", "% of Banned", "Avg Ydstogo"]
-    situation_df["Avg Ydstogo"] = situation_df["Avg Ydstogo"].round(1)
-    situation_df.index.name = "Situation"
 
-    return summary, team_table, situation_df, banned
+# ── Data loading ───────────────────────────────────────────────────────────────
+# cache_resource hands every caller the same frame instead of unpickling a
+# fresh copy per call. Callers must treat it as read-only: slice it, never
+# assign into it.
+@st.cache_resource(ttl=CACHE_TTL, show_spinner="Loading NFL play-by-play data…")
+def load_pbp(season: int) -> pd.DataFrame:
+    cache_path = os.path.join(CACHE_DIR, f"pbp_{season}_v{CACHE_VERSION}.parquet")
+    if _is_fresh(cache_path):
+        # An unreadable file (e.g. left by a killed writer) is just a miss.
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception:
+            pass
 
+    # Imported here so workers served from the parquet cache never load it.
+    import nfl_data_py as nfl
 
-# ── Computation: field goals ───────────────────────────────────────────────────
-@st.cache_data(ttl=86400, show_spinner=False)
-def compute_fgs(season: int):
+    pbp = nfl.import_pbp_data([season], downcast=True)
+    _check_cols(pbp, REQUIRED_COLS, "play-by-play")
+    pbp = pbp[[c for c in pbp.columns if c in NEEDED_COLS]]
+    pbp = pbp.astype({c: "category" for c in CATEGORY_COLS if c in pbp.columns})
+
+    # Finish what downcast=True may miss; same float32 policy as
+    # banned_punt_analysis.py.
+    pbp = pbp.astype({c: "float32" for c in pbp.select_dtypes("float64").columns})
+    pbp = pbp[pbp["season_type"] == "REG"]
+
+    # ydstogo bucket, coded once so every slice inherits it; same binning as
+    # banned_punt_analysis.py (-1 / NaN for missing or negative distances).
+    ytg  = pbp["ydstogo"].to_numpy()
+    code = np.searchsorted(BUCKET_BINS[1:-1], ytg, side="left").astype(np.int8)
+    code[np.isnan(ytg) | (ytg < BUCKET_BINS[0])] = -1
+    pbp = pbp.assign(bucket=pd.Categorical.from_codes(code, categories=BUCKET_LABELS, ordered=True))
+
+    # Best effort — a read-only deploy just falls back to downloading each time.
+    # Written via a temp file, as in _disk_cached.
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        pbp.to_parquet(cache_path + ".tmp", compression="zstd")
+        os.replace(cache_path + ".tmp", cache_path)
+    except OSError:
+        pass
+    return pbp
+
+
+# ── Computation: punts, field goals, EPA swing ────────────────────────────────
+# One pass over the season frame: the play-type masks are built once and every
+# punt / FG / 4th-down table is derived from the same slices, instead of three
+# separately cached functions each re-filtering pbp.
+# Only `season` is a cache key. exclude_2min just decides which of the (small)
+# opp-territory punts count as banned, so compute_all re-derives the punt and
+# EPA-swing tables from the cached core on each run instead of caching a second
+# full copy per checkbox state. min_punts is applied in the UI for the same
+# reason.
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _compute_core(season: int) -> dict:
+    return _disk_cached("core", season, _build_core)
+
+
+def _build_core(season: int) -> dict:
     pbp = load_pbp(season)
-    _check_cols(pbp, REQUIRED_FG_COLS, "field goals")
 
-    fgs       = pbp[pbp["play_type"] == "field_goal"].copy()
-    long_fgs  = fgs[fgs["kick_distance"] >= 60]
-    made_long = long_fgs[long_fgs["field_goal_result"] == "made"]
+    # Plain boolean arrays, combined with & and used to slice pbp once each.
+    play_type = pbp["play_type"]
+    m_punt    = (play_type == "punt").to_numpy()
+    m_opp     = m_punt & (pbp["yardline_100"].to_numpy() < 50)
+    m_fg      = (play_type == "field_goal").to_numpy()
+    m_long_fg = m_fg & (pbp["kick_distance"].to_numpy() >= 60)
+    m_4th_go  = (pbp["down"].to_numpy() == 4) & play_type.isin(["run", "pass"]).to_numpy()
+
+    # ── Field goals ────────────────────────────────────────────────────────────
+    long_fgs = pbp[m_long_fg].assign(
+        made=lambda df: (df["field_goal_result"] == "made").astype(int)
+    )
 
     n_att  = len(long_fgs)
-    n_made = len(made_long)
+    n_made = int(long_fgs["made"].sum())
 
-    summary = {
-        "total_attempts": len(fgs),
+    fg_summary = {
+        "total_attempts": int(m_fg.sum()),
         "long_attempts":  n_att,
         "long_made":      n_made,
         "make_pct":       n_made / n_att * 100 if n_att > 0 else 0.0,
         "extra_points":   n_made,
     }
 
-    team_fgs = (
-        long_fgs.groupby("posteam")
+    team_fg_table = (
+        long_fgs.groupby("posteam", observed=True)
         .agg(
-            att  =("field_goal_result", "count"),
-            made =("field_goal_result", lambda x: (x == "made").sum()),
+            att  =("made", "size"),
+            made =("made", "sum"),
         )
         .assign(
             make_pct  =lambda df: (df["made"] / df["att"] * 100).round(1),
             extra_pts =lambda df: df["made"].astype(int),
         )
-        .sort_values("extra_pts", ascending=False)
+        .sort_index()
+        .sort_values("extra_pts", ascending=False, kind="stable")
+    )
+    team_fg_table.index.name = "Team"
+    team_fg_table.columns    = ["Attempts (60+)", "Made (60+)", "Make %", "Extra Pts"]
+
+    # ── 4th-down go-for-it baseline ────────────────────────────────────────────
+    fourth_go = pbp[m_4th_go]
+
+    # Outcome-split EPA as masked columns, so one groupby covers attempts,
+    # conversion rate and both conditional means.
+    converted = fourth_go["fourth_down_converted"]
+    go_stats = (
+        fourth_go.assign(
+            epa_conv=fourth_go["epa"].where(converted == 1),
+            epa_fail=fourth_go["epa"].where(converted == 0),
+        )
+        .groupby("bucket", observed=True, sort=False)
+        .agg(
+            go_attempts     =("fourth_down_converted", "count"),
+            conv_rate       =("fourth_down_converted", "mean"),
+            epa_if_converted=("epa_conv", "mean"),
+            epa_if_failed   =("epa_fail", "mean"),
+        )
     )
-    team_fgs.index.name = "Team"
-    team_fgs.columns    = ["Attempts (60+)", "Made (60+)", "Make %", "Extra Pts"]
 
-    return summary, team_fgs
+    return {
+        "n_punts":       int(m_punt.sum()),
+        "punts_by_team": pbp.loc[m_punt, "posteam"].value_counts(sort=False).loc[lambda n: n > 0],
+        "punts_in_opp":  pbp[m_opp],
+        "fg_summary":    fg_summary,
+        "team_fg_table": team_fg_table,
+        "go_stats":      go_stats,
+    }
 
 
-# ── Computation: EPA swing ─────────────────────────────────────────────────────
-@st.cache_data(ttl=86400, show_spinner=False)
-def compute_epa_swing(season: int, exclude_2min: bool):
-    pbp = load_pbp(season)
-    _check_cols(pbp, REQUIRED_EPA_COLS, "EPA swing")
+def compute_all(season: int, exclude_2min: bool) -> dict:
+    core         = _compute_core(season)
+    punts_in_opp = core["punts_in_opp"]
 
-    punts_in_opp = pbp[(pbp["play_type"] == "punt") & (pbp["yardline_100"] < 50)]
-    banned = (
-        punts_in_opp[punts_in_opp["half_seconds_remaining"] > 120].copy()
-        if exclude_2min else punts_in_opp.copy()
-    )
+    if exclude_2min:
+        half_secs = punts_in_opp["half_seconds_remaining"].to_numpy()
+        n_exempt  = int(np.count_nonzero(half_secs <= 120))
+        banned    = punts_in_opp[half_secs > 120]
+    else:
+        n_exempt  = 0
+        banned    = punts_in_opp
 
-    fourth_go = pbp[
-        (pbp["down"] == 4) & (pbp["play_type"].isin(["run", "pass"]))
-    ].copy()
+    n_total  = core["n_punts"]
+    n_opp    = len(punts_in_opp)
+    n_banned = len(banned)
 
-    for df in (fourth_go, banned):
-        df["bucket"] = pd.cut(
-            df["ydstogo"], bins=BUCKET_BINS,
-            labels=BUCKET_LABELS, right=True, include_lowest=True,
-        )
+    punt_summary = {
+        "total_punts":   n_total,
+        "opp_territory": n_opp,
+        "exempt":        n_exempt,
+        "banned":        n_banned,
+        "pct_banned":    n_banned / n_total * 100 if n_total > 0 else 0.0,
+    }
 
-    _attempts = (
-        fourth_go.groupby("bucket", observed=True)["fourth_down_converted"]
-        .agg(go_attempts="count", conv_rate="mean")
-    )
-    _epa_conv = (
-        fourth_go[fourth_go["fourth_down_converted"] == 1]
-        .groupby("bucket", observed=True)["epa"].mean()
-        .rename("epa_if_converted")
+    # Team table (unfiltered — min_punts applied in UI)
+    punts_by_team  = core["punts_by_team"]
+    banned_by_team = banned["posteam"].value_counts(sort=False)
+    team_punt_table = (
+        pd.DataFrame({
+            "total_punts":  punts_by_team,
+            "banned_punts": banned_by_team.reindex(punts_by_team.index, fill_value=0),
+        })
+        .assign(pct_banned=lambda df: (df["banned_punts"] / df["total_punts"] * 100).round(1))
+        .sort_values("banned_punts", ascending=False)
     )
-    _epa_fail = (
-        fourth_go[fourth_go["fourth_down_converted"] == 0]
-        .groupby("bucket", observed=True)["epa"].mean()
-        .rename("epa_if_failed")
+    team_punt_table.index.name = "Team"
+    team_punt_table.columns    = ["Total Punts", "Banned Punts", "% Banned"]
+
+    # Situation breakdown. score_situation's ordered categorical with
+    # observed=False yields every situation in SITUATION_ORDER, empty ones as 0.
+    # Grouping ydstogo by it directly avoids copying banned to add a column.
+    situation_df = (
+        banned["ydstogo"].groupby(score_situation(banned["score_differential"]), observed=False)
+        .agg(count="count", avg_ydstogo="mean")
+        .assign(pct=lambda df: (df["count"] / n_banned * 100).round(1) if n_banned > 0 else 0)
+        [["count", "pct", "avg_ydstogo"]]
     )
+    situation_df.columns    = ["Count", "% of Banned", "Avg Ydstogo"]
+    situation_df["Avg Ydstogo"] = situation_df["Avg Ydstogo"].round(1)
+    situation_df.index = situation_df.index.astype(str).rename("Situation")  # plain labels for the bar axis
+
+    # EPA swing: cached go-for-it baseline vs. this run's banned punts. Both
+    # sides group unsorted; the reindex below fixes the bucket order.
     _punt_epa = (
-        banned.groupby("bucket", observed=True)["epa"].mean()
+        banned.groupby("bucket", observed=True, sort=False)["epa"].mean()
         .rename("avg_punt_epa")
     )
 
-    tbl = _attempts.join(_epa_conv).join(_epa_fail).join(_punt_epa).reindex(BUCKET_LABELS)
-    tbl["exp_epa_go"] = (
-        tbl["conv_rate"] * tbl["epa_if_converted"]
-        + (1 - tbl["conv_rate"]) * tbl["epa_if_failed"]
+    epa_table = core["go_stats"].join(_punt_epa).reindex(BUCKET_LABELS)
+    epa_table["exp_epa_go"] = (
+        epa_table["conv_rate"] * epa_table["epa_if_converted"]
+        + (1 - epa_table["conv_rate"]) * epa_table["epa_if_failed"]
     )
-    tbl["epa_swing"] = tbl["exp_epa_go"] - tbl["avg_punt_epa"]
+    epa_table["epa_swing"] = epa_table["exp_epa_go"] - epa_table["avg_punt_epa"]
 
-    tbl.index.name = "Yards to Go"
-    tbl.columns    = [
+    epa_table.index.name = "Yards to Go"
+    epa_table.columns    = [
         "Go Attempts", "Conv Rate", "EPA if Conv",
         "EPA if Failed", "Exp EPA (Go)", "Avg Punt EPA", "EPA Swing",
     ]
-    return tbl
+
+    return {
+        "punt_summary":    punt_summary,
+        "team_punt_table": team_punt_table,
+        "situation_df":    situation_df,
+        "banned_df":       banned,
+        "fg_summary":      core["fg_summary"],
+        "team_fg_table":   core["team_fg_table"],
+        "epa_table":       epa_table,
+    }
+
+
+# ── Computation: game finals ───────────────────────────────────────────────────
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _game_finals(season: int) -> pd.DataFrame:
+    # One row per game: home team and final score (max of the running totals).
+    # Season-level, so any view that needs game results shares this one pass.
+    pbp = load_pbp(season)
+    return pbp.groupby("game_id", observed=True, sort=False).agg(
+        home_team=("home_team", "first"),
+        final_home=("total_home_score", "max"),
+        final_away=("total_away_score", "max"),
+    )
 
 
 # ── Computation: tush push ─────────────────────────────────────────────────────
-@st.cache_data(ttl=86400, show_spinner=False)
+# Season-only like the core tables, so a fresh worker with a warm .cache/ reads
+# the pickled result instead of re-scanning pbp.
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
 def compute_tush_push(season: int):
+    return _disk_cached("tush", season, _build_tush_push)
+
+
+def _build_tush_push(season: int) -> dict:
     pbp = load_pbp(season)
-    _check_cols(pbp, REQUIRED_SNEAK_COLS, "tush push")
 
     # ── Identify QB sneaks ────────────────────────────────────────────────────
     # Prefer qb_sneak column if it exists and is actually populated
     if "qb_sneak" in pbp.columns and int(pbp["qb_sneak"].sum()) > 0:
-        sneaks = pbp[pbp["qb_sneak"] == 1].copy()
+        sneaks = pbp[pbp["qb_sneak"] == 1]
     else:
         # Heuristic: short-yardage rush where the rusher is the team's primary QB.
         # Primary QB = player with the most pass attempts for that team in that game.
+        # Pass counts per (game, team, passer); a stable descending sort keeps
+        # passers in id order within ties, so the first row per (game, team)
+        # is the same pick as mode().iloc[0].
         qb_by_game = (
-            pbp[pbp["pass_attempt"] == 1]
-            .groupby(["game_id", "posteam"])["passer_player_id"]
-            .agg(lambda x: x.dropna().mode().iloc[0] if x.dropna().size > 0 else None)
+            pbp.loc[pbp["pass_attempt"] == 1, ["game_id", "posteam", "passer_player_id"]]
+            .dropna(subset=["passer_player_id"])
+            .groupby(["game_id", "posteam", "passer_player_id"], observed=True).size()
+            .sort_values(ascending=False, kind="stable")
             .reset_index()
+            .drop_duplicates(["game_id", "posteam"])
             .rename(columns={"passer_player_id": "primary_qb_id"})
+            [["game_id", "posteam", "primary_qb_id"]]
         )
         rushes = (
             pbp[(pbp["rush_attempt"] == 1) & (pbp["ydstogo"] == 1)]
@@ -253,7 +390,7 @@ def compute_tush_push(season: int):
         )
         sneaks = rushes[
             rushes["rusher_player_id"] == rushes["primary_qb_id"]
-        ].copy()
+        ]
 
     # 3rd/4th down conversions (where "conversion" is meaningful)
     sneaks_crit = sneaks[sneaks["down"].isin([3, 4])].copy()
@@ -265,18 +402,20 @@ def compute_tush_push(season: int):
 
     # Team counts (all downs), sorted ascending so highest lands at top of h-bar
     team_counts = (
-        sneaks.groupby("posteam").size()
-        .sort_values(ascending=True)
+        sneaks.groupby("posteam", observed=True).size()
+        .sort_index()
+        .sort_values(ascending=True, kind="stable")
         .reset_index()
     )
     team_counts.columns = ["Team", "QB Sneaks"]
+    team_counts["Team"] = team_counts["Team"].astype(str)  # plain labels for the bar axis
     team_counts["color"] = [
         "#004c54" if t == "PHI" else "#b0b8c1" for t in team_counts["Team"]
     ]
 
-    # Eagles subset
-    eagles = sneaks[sneaks["posteam"] == "PHI"].copy()
-    eagles_crit = sneaks_crit[sneaks_crit["posteam"] == "PHI"].copy()
+    # Eagles subset (read-only slices; nothing below writes to them)
+    eagles = sneaks[sneaks["posteam"] == "PHI"]
+    eagles_crit = sneaks_crit[sneaks_crit["posteam"] == "PHI"]
     eagles_conv = eagles_crit["converted"].mean() if len(eagles_crit) > 0 else 0.0
 
     # Eagles by down
@@ -290,10 +429,6 @@ def compute_tush_push(season: int):
     eagles_by_down = eagles_by_down[["Down", "Count"]]
 
     # Eagles by ydstogo bucket
-    eagles["bucket"] = pd.cut(
-        eagles["ydstogo"], bins=BUCKET_BINS,
-        labels=BUCKET_LABELS, right=True, include_lowest=True,
-    )
     eagles_by_ydstogo = (
         eagles.groupby("bucket", observed=True).size()
         .rename("Count")
@@ -305,9 +440,8 @@ def compute_tush_push(season: int):
     eagles_by_ydstogo.columns = ["Yards to Go", "Count"]
 
     # Eagles by game situation
-    eagles["situation"] = eagles["score_differential"].apply(score_situation)
     eagles_by_sit = (
-        eagles.groupby("situation").size()
+        eagles.groupby(score_situation(eagles["score_differential"]), observed=True).size()
         .rename("Count")
         .reindex(SITUATION_ORDER)
         .reset_index()
@@ -315,22 +449,16 @@ def compute_tush_push(season: int):
     eagles_by_sit.columns = ["Situation", "Count"]
 
     # Games won with a critical converted sneak (3rd/4th down, Eagles, converted)
-    critical_game_ids = set(eagles_crit[eagles_crit["converted"]]["game_id"].unique())
-    final = pbp.groupby("game_id").agg(
-        home_team=("home_team", "first"),
-        final_home=("total_home_score", "max"),
-        final_away=("total_away_score", "max"),
-    )
-    wins_crit = sum(
-        (
-            (final.loc[gid, "home_team"] == "PHI" and
-             final.loc[gid, "final_home"] > final.loc[gid, "final_away"])
-            or
-            (final.loc[gid, "home_team"] != "PHI" and
-             final.loc[gid, "final_away"] > final.loc[gid, "final_home"])
-        )
-        for gid in critical_game_ids if gid in final.index
+    critical_game_ids = eagles_crit.loc[eagles_crit["converted"], "game_id"].unique()
+    final    = _game_finals(season)
+    crit     = final[final.index.isin(critical_game_ids)]
+    phi_home = (crit["home_team"] == "PHI").to_numpy()
+    won      = np.where(
+        phi_home,
+        crit["final_home"] > crit["final_away"],
+        crit["final_away"] > crit["final_home"],
     )
+    wins_crit = int(won.sum())
 
     return {
         "n_total":       len(sneaks),
@@ -369,9 +497,10 @@ CHART_LAYOUT = dict(
 )
 
 # ══════════════════════════════════════════════════════════════════════════════
-# CSS INJECTION
+# CSS / HEADER HTML
 # ══════════════════════════════════════════════════════════════════════════════
-st.markdown(f"""
+# Built once from the brand constants and handed to st.markdown below.
+CSS_BLOCK = f"""
 <style>
 /* ── Global background & text ───────────────────────────────────────── */
 [data-testid="stAppViewContainer"] {{
@@ -488,7 +617,27 @@ hr {{
     font-size: 0.78rem !important;
 }}
 </style>
-""", unsafe_allow_html=True)
+"""
+
+HEADER_TITLE_HTML = (
+    f"<h1 style='color:{TEXT};font-weight:900;font-size:1.75rem;"
+    f"letter-spacing:-0.01em;margin:0;padding:0;line-height:1.15;'>"
+    f"UFL RULE IMPACT</h1>"
+    f"<p style='color:{MUTED};font-size:0.85rem;margin:2px 0 0 0;'>"
+    f"NFL Regular Season Analysis</p>"
+)
+
+HEADER_RIGHT_HTML = (
+    f"<div style='text-align:right;padding-top:6px;'>"
+    f"<p style='color:{TEAL};font-weight:800;font-size:0.72rem;"
+    f"letter-spacing:0.1em;text-transform:uppercase;margin:0;'>"
+    f"🎙️ Gus &amp; Dave Sports Podcast</p>"
+    f"<p style='color:{MUTED};font-size:0.68rem;margin:3px 0 0 0;'>"
+    f"Created by Brennan Simpson</p>"
+    f"</div>"
+)
+
+st.markdown(CSS_BLOCK, unsafe_allow_html=True)
 
 # ══════════════════════════════════════════════════════════════════════════════
 # UI
@@ -527,36 +676,13 @@ with header_left:
         with logo_col:
             st.image(LOGO_PATH, width=64)
         with title_col:
-            st.markdown(
-                f"<h1 style='color:{TEXT};font-weight:900;font-size:1.75rem;"
-                f"letter-spacing:-0.01em;margin:0;padding:0;line-height:1.15;'>"
-                f"UFL RULE IMPACT</h1>"
-                f"<p style='color:{MUTED};font-size:0.85rem;margin:2px 0 0 0;'>"
-                f"NFL Regular Season Analysis</p>",
-                unsafe_allow_html=True,
-            )
+            st.markdown(HEADER_TITLE_HTML, unsafe_allow_html=True)
         logo_shown = True
     if not logo_shown:
-        st.markdown(
-            f"<h1 style='color:{TEXT};font-weight:900;font-size:1.75rem;"
-            f"letter-spacing:-0.01em;margin:0;padding:0;line-height:1.15;'>"
-            f"UFL RULE IMPACT</h1>"
-            f"<p style='color:{MUTED};font-size:0.85rem;margin:2px 0 0 0;'>"
-            f"NFL Regular Season Analysis</p>",
-            unsafe_allow_html=True,
-        )
+        st.markdown(HEADER_TITLE_HTML, unsafe_allow_html=True)
 
 with header_right:
-    st.markdown(
-        f"<div style='text-align:right;padding-top:6px;'>"
-        f"<p style='color:{TEAL};font-weight:800;font-size:0.72rem;"
-        f"letter-spacing:0.1em;text-transform:uppercase;margin:0;'>"
-        f"🎙️ Gus &amp; Dave Sports Podcast</p>"
-        f"<p style='color:{MUTED};font-size:0.68rem;margin:3px 0 0 0;'>"
-        f"Created by Brennan Simpson</p>"
-        f"</div>",
-        unsafe_allow_html=True,
-    )
+    st.markdown(HEADER_RIGHT_HTML, unsafe_allow_html=True)
 
 st.markdown(
     f"<p style='color:{MUTED};font-size:0.78rem;margin:10px 0 4px 0;'>"
@@ -568,16 +694,20 @@ st.divider()
 
 # ── Load & compute (errors surface here, outside cache) ───────────────────────
 try:
-    punt_summary, team_punt_table, situation_df, banned_df = compute_punts(
-        season, exclude_2min
-    )
-    fg_summary, team_fg_table = compute_fgs(season)
-    epa_table = compute_epa_swing(season, exclude_2min)
+    results        = compute_all(season, exclude_2min)
     tush_push_data = compute_tush_push(season)
 except Exception as e:
     st.error(f"❌ Data error: {e}")
     st.stop()
 
+punt_summary    = results["punt_summary"]
+team_punt_table = results["team_punt_table"]
+situation_df    = results["situation_df"]
+banned_df       = results["banned_df"]
+fg_summary      = results["fg_summary"]
+team_fg_table   = results["team_fg_table"]
+epa_table       = results["epa_table"]
+
 # Apply min_punts filter here (in UI) so it doesn't bust the compute cache
 team_punt_display = (
     team_punt_table[team_punt_table["Total Punts"] >= min_punts]
@@ -600,10 +730,13 @@ with tab1:
     )
 
     # ── Contextual summary ────────────────────────────────────────────────
-    _sit_clean = situation_df.dropna(subset=["Count"])
+    _sit_clean = situation_df[situation_df["Count"] > 0]
     _top_sit = _sit_clean["Count"].idxmax() if len(_sit_clean) else "N/A"
     _top_sit_pct = _sit_clean.loc[_top_sit, "% of Banned"] if _top_sit != "N/A" else 0
-    _median_ydstogo = banned_df["ydstogo"].median() if len(banned_df) else 0
+    # Plain ndarray for the scalar stats and histogram below.
+    _ydstogo = banned_df["ydstogo"].to_numpy(dtype=np.float64)
+    _ydstogo = _ydstogo[~np.isnan(_ydstogo)]
+    _median_ydstogo = np.median(_ydstogo) if len(_ydstogo) else 0
     st.info(
         "**Assumption:** Punts are classified as 'banned' if they occur inside the "
         "opponent's 50-yard line outside the 2-minute warning exemption window. "
@@ -633,7 +766,7 @@ with tab1:
 
     with col_l:
         st.markdown("#### Banned Punts by Score Situation")
-        bar_data = situation_df.dropna(subset=["Count"]).reset_index()
+        bar_data = situation_df[situation_df["Count"] > 0].reset_index()
         fig_bar = px.bar(
             bar_data,
             x="Situation",
@@ -653,12 +786,13 @@ with tab1:
 
     with col_r:
         st.markdown("#### Yards to Go Distribution")
-        ydstogo_vals = banned_df["ydstogo"].dropna()
-        mean_val   = ydstogo_vals.mean()
-        median_val = ydstogo_vals.median()
+        mean_val   = _ydstogo.mean()
+        median_val = _median_ydstogo
 
-        fig_hist = px.histogram(
-            x=ydstogo_vals, nbins=25,
+        # Binned here so only the bar counts go to the browser, not every play.
+        counts, edges = np.histogram(_ydstogo, bins=_yard_bins(_ydstogo))
+        fig_hist = px.bar(
+            x=(edges[:-1] + edges[1:]) / 2, y=counts,
             labels={"x": "Yards to Go", "y": "Frequency"},
             color_discrete_sequence=[TEAL],
         )
@@ -677,6 +811,7 @@ with tab1:
         fig_hist.update_layout(
             showlegend=False,
             yaxis_title="Frequency",
+            bargap=0,
             **CHART_LAYOUT,
         )
         st.plotly_chart(fig_hist, width="stretch")
@@ -5,6 +5,7 @@ We are modeling rule impacts, not game theory responses.
 Assume teams behave exactly as they did historically.
 """
 
+import numpy as np
 import nfl_data_py as nfl
 
 # ── Load data ──────────────────────────────────────────────────────────────────
@@ -51,15 +52,15 @@ print("=" * 60)
 print("SECTION 1a — PUNTS BY TEAM")
 print("=" * 60)
 
+# Flag illegal punts once (same rule as above) so the per-team count is a plain
+# column sum rather than a per-group lookup back into punts.
 team_punts = (
     punts
+    .assign(is_illegal=(punts["yardline_100"] < 50) & (punts["half_seconds_remaining"] > 120))
     .groupby("posteam")
     .agg(
         total_punts   =("play_type", "count"),
-        illegal_punts =(
-            "yardline_100",
-            lambda x: ((x < 50) & (punts.loc[x.index, "half_seconds_remaining"] > 120)).sum()
-        ),
+        illegal_punts =("is_illegal", "sum"),
     )
     .assign(pct_illegal=lambda df: (df["illegal_punts"] / df["total_punts"] * 100).round(1))
     .sort_values("illegal_punts", ascending=False)
@@ -101,12 +102,14 @@ print("=" * 60)
 print("SECTION 2a — 60+ YARD FIELD GOALS BY TEAM")
 print("=" * 60)
 
+# Flag makes once so the per-team sum is a plain column reduction.
 team_fgs = (
     long_fgs
+    .assign(is_made=long_fgs["field_goal_result"] == "made")
     .groupby("posteam")
     .agg(
         fg_att_60plus =("field_goal_result", "count"),
-        fg_made_60plus=("field_goal_result", lambda x: (x == "made").sum()),
+        fg_made_60plus=("is_made", "sum"),
     )
     .assign(
         make_pct  =lambda df: (df["fg_made_60plus"] / df["fg_att_60plus"] * 100).round(1),
@@ -123,9 +126,10 @@ print()
 # ==============================================================================
 
 # Build a final-score lookup: max cumulative score per game = final score.
+# Only used as a join table, so group keys are left unsorted.
 final_scores = (
     pbp
-    .groupby("game_id")
+    .groupby("game_id", sort=False)
     .agg(
         final_home_score =("total_home_score", "max"),
         final_away_score =("total_away_score", "max"),
@@ -133,20 +137,23 @@ final_scores = (
     .reset_index()
 )
 
-# Join final scores onto each made 60+ FG play.
+# Look up final scores for each made 60+ FG play by game_id (a handful of rows,
+# so a keyed map rather than a full merge).
 # home_team is already present on made_long_fgs (inherited from pbp).
-made_with_result = made_long_fgs.merge(
-    final_scores[["game_id", "final_home_score", "final_away_score"]],
-    on="game_id",
-    how="left",
+final_by_game    = final_scores.set_index("game_id")
+made_with_result = made_long_fgs.assign(
+    final_home_score=made_long_fgs["game_id"].map(final_by_game["final_home_score"]),
+    final_away_score=made_long_fgs["game_id"].map(final_by_game["final_away_score"]),
 )
 
-# Margin from the kicking team's perspective (negative = loss).
+# Margin from the kicking team's perspective (negative = loss): the home margin,
+# sign-flipped when the kicking team was away.
+is_home = made_with_result["posteam"].to_numpy() == made_with_result["home_team"].to_numpy()
 made_with_result = made_with_result.assign(
-    team_margin=lambda df: (
-        (df["final_home_score"] - df["final_away_score"])
-        .where(df["posteam"] == df["home_team"],
-               df["final_away_score"] - df["final_home_score"])
+    team_margin=np.where(
+        is_home,
+        made_with_result["final_home_score"].to_numpy() - made_with_result["final_away_score"].to_numpy(),
+        made_with_result["final_away_score"].to_numpy() - made_with_result["final_home_score"].to_numpy(),
     )
 )
 